@@ -5,6 +5,11 @@ Test Kustomize configuration
 import yaml
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 def test_kustomize_config():
     """Test kustomization.yaml configuration"""
     errors = []
@@ -18,8 +23,8 @@ def test_kustomize_config():
         return errors, warnings
 
     try:
-        with open(kustomization_file, 'r') as f:
-            config = yaml.safe_load(f)
+        raw = kustomization_file.read_bytes()
+        config = yaml.load(raw, Loader=SafeLoader)
 
         # Check apiVersion and kind
         if config.get('apiVersion') != 'kustomize.config.k8s.io/v1beta1':
@@ -73,12 +78,9 @@ def test_kustomize_config():
                 print(f"   {key}: {value}")
 
         # Check for commented generators (informational)
-        with open(kustomization_file, 'r') as f:
-            content = f.read()
-
-        if '# configMapGenerator' in content:
+        if b'# configMapGenerator' in raw:
             print(f"\n💡 Note: ConfigMap generator is commented out (using configmap.yaml)")
-        if '# secretGenerator' in content:
+        if b'# secretGenerator' in raw:
             print(f"💡 Note: Secret generator is commented out (using secret.yaml)")
 
     except yaml.YAMLError as e:
@@ -2,10 +2,164 @@
 """
 Validate Dockerfile for best practices and common issues
 """
+import functools
+import json
+import os
 import re
 import sys
 from pathlib import Path
 
+_FROM_RE = re.compile(rb'FROM\s+([\w/:.-]+)(?:\s+AS\s+(\w+))?', re.IGNORECASE)
+
+# Instruction keyword at the start of a line, plus its (stripped) arguments
+_INSTR_RE = re.compile(
+    rb'\s*(FROM|USER|HEALTHCHECK|ENTRYPOINT|CMD|RUN|COPY|WORKDIR|EXPOSE)(?:\s+(.*?))?\s*$',
+    re.IGNORECASE,
+)
+
+# A line with 'apk add' but no cache cleanup, followed by a line that doesn't clean up either
+_APK_NO_CLEAN_RE = re.compile(
+    rb'^(?!.*rm -rf /var/cache/apk/\*).*apk add.*\n(?!\Z)(?!.*rm -rf /var/cache/apk/\*)',
+    re.MULTILINE,
+)
+
+@functools.lru_cache(maxsize=4096)
+def _exists(path):
+    """Cached os.path.exists; the validator never mutates files during a run"""
+    return os.path.exists(path)
+
+class _DockerfileState:
+    """Characteristics collected while scanning a Dockerfile"""
+    __slots__ = (
+        'apk_uncleaned', 'errors', 'warnings', 'info',
+        'has_from', 'has_user', 'has_healthcheck', 'has_entrypoint', 'has_cmd',
+        'base_image', 'uses_multi_stage', 'stage_names', 'run_commands', 'copy_commands',
+        'current_stage',
+    )
+
+    def __init__(self, apk_uncleaned, errors, warnings, info):
+        self.apk_uncleaned = apk_uncleaned
+        self.errors = errors
+        self.warnings = warnings
+        self.info = info
+        self.has_from = False
+        self.has_user = False
+        self.has_healthcheck = False
+        self.has_entrypoint = False
+        self.has_cmd = False
+        self.base_image = None
+        self.uses_multi_stage = False
+        self.stage_names = []
+        self.run_commands = []
+        self.copy_commands = []
+        self.current_stage = None
+
+def _find_apk_uncleaned(content):
+    """Return line numbers of 'apk add' lines whose cache is not cleaned"""
+    flagged = set()
+    line_no = 1
+    pos = 0
+    for match in _APK_NO_CLEAN_RE.finditer(content):
+        line_no += content.count(b'\n', pos, match.start())
+        pos = match.start()
+        flagged.add(line_no)
+    return flagged
+
+def _handle_from(i, stripped, rest, state):
+    state.has_from = True
+    match = _FROM_RE.match(stripped)
+    if match:
+        # Only the matched tokens are decoded; everything else stays bytes
+        image = match.group(1).decode('utf-8', 'replace')
+        stage_name = match.group(2) and match.group(2).decode('utf-8', 'replace')
+
+        if stage_name:
+            state.uses_multi_stage = True
+            state.stage_names.append(stage_name)
+            state.current_stage = stage_name
+
+        if state.base_image is None:
+            state.base_image = image
+
+            # Check base image
+            if ':latest' in image or ':' not in image:
+                state.warnings.append(f"Line {i}: Base image uses 'latest' or no tag: {image}")
+
+            if 'alpine' in image:
+                state.info.append(f"Line {i}: Using Alpine Linux base (good for size)")
+
+            if 'node:20' in image:
+                state.info.append(f"Line {i}: Using Node.js 20 LTS (good choice)")
+
+def _handle_user(i, stripped, rest, state):
+    state.has_user = True
+    user = rest.split(None, 1)[0].decode('utf-8', 'replace') if rest else ''
+    if user == 'root':
+        state.errors.append(f"Line {i}: Running as root user (security risk)")
+    else:
+        state.info.append(f"Line {i}: Running as non-root user '{user}' (good)")
+
+def _handle_healthcheck(i, stripped, rest, state):
+    state.has_healthcheck = True
+    state.info.append(f"Line {i}: Health check configured (good)")
+
+def _handle_entrypoint(i, stripped, rest, state):
+    state.has_entrypoint = True
+    if b'tini' in stripped or b'dumb-init' in stripped:
+        state.info.append(f"Line {i}: Using init system for signal handling (good)")
+
+def _handle_cmd(i, stripped, rest, state):
+    state.has_cmd = True
+
+def _handle_run(i, stripped, rest, state):
+    state.run_commands.append((i, stripped))
+
+    # Check for apt-get without -y
+    if b'apt-get' in stripped and b'-y' not in stripped and b'--yes' not in stripped:
+        state.warnings.append(f"Line {i}: apt-get without -y (may hang)")
+
+    # Check for cache cleanup
+    if b'apt-get install' in stripped and b'rm -rf /var/lib/apt/lists/*' not in stripped:
+        state.warnings.append(f"Line {i}: apt-get install without cache cleanup")
+
+    # Cleanup on the same or next line was resolved in one pass up front
+    if i in state.apk_uncleaned:
+        state.info.append(f"Line {i}: Consider cleaning apk cache in same RUN")
+
+    # Check for npm ci vs npm install
+    if b'npm install' in stripped and b'npm ci' not in stripped:
+        state.warnings.append(f"Line {i}: Use 'npm ci' instead of 'npm install' for reproducible builds")
+    elif b'npm ci' in stripped:
+        state.info.append(f"Line {i}: Using 'npm ci' for reproducible builds (good)")
+
+def _handle_copy(i, stripped, rest, state):
+    state.copy_commands.append((i, stripped))
+
+    # Check for --chown flag
+    if b'--chown' in stripped:
+        state.info.append(f"Line {i}: Using --chown in COPY (efficient)")
+
+def _handle_workdir(i, stripped, rest, state):
+    if not stripped.startswith(b'WORKDIR /'):
+        state.warnings.append(f"Line {i}: WORKDIR should use absolute path")
+
+def _handle_expose(i, stripped, rest, state):
+    port = rest.split(None, 1)[0].decode('utf-8', 'replace') if rest else ''
+    state.info.append(f"Line {i}: Exposing port {port}")
+
+# Instruction keyword -> handler, keyed by the upper-cased _INSTR_RE match
+_HANDLERS = {
+    b'FROM': _handle_from,
+    b'USER': _handle_user,
+    b'HEALTHCHECK': _handle_healthcheck,
+    b'ENTRYPOINT': _handle_entrypoint,
+    b'CMD': _handle_cmd,
+    b'RUN': _handle_run,
+    b'COPY': _handle_copy,
+    b'WORKDIR': _handle_workdir,
+    b'EXPOSE': _handle_expose,
+}
+
 def validate_dockerfile(dockerfile_path):
     """Validate Dockerfile structure and best practices"""
     errors = []
@@ -13,144 +167,50 @@ def validate_dockerfile(dockerfile_path):
     info = []
 
     try:
-        with open(dockerfile_path, 'r') as f:
-            lines = f.readlines()
+        # Every check looks for ASCII tokens, so scan raw bytes and skip decoding
+        with open(dockerfile_path, 'rb') as f:
+            content = f.read()
 
         # Track Dockerfile characteristics
-        has_from = False
-        has_user = False
-        has_healthcheck = False
-        has_entrypoint = False
-        has_cmd = False
-        base_image = None
-        uses_multi_stage = False
-        stage_names = []
-        run_commands = []
-        copy_commands = []
-
-        current_stage = None
-
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-
-            # Skip comments and empty lines
-            if not stripped or stripped.startswith('#'):
+        state = _DockerfileState(
+            apk_uncleaned=_find_apk_uncleaned(content),
+            errors=errors,
+            warnings=warnings,
+            info=info,
+        )
+
+        for i, line in enumerate(content.split(b'\n'), 1):
+            # Comments, blank lines and continuations simply don't match
+            match = _INSTR_RE.match(line)
+            if not match:
                 continue
 
-            # Check for FROM
-            if stripped.upper().startswith('FROM'):
-                has_from = True
-                match = re.match(r'FROM\s+([\w/:.-]+)(?:\s+AS\s+(\w+))?', stripped, re.IGNORECASE)
-                if match:
-                    image = match.group(1)
-                    stage_name = match.group(2)
-
-                    if stage_name:
-                        uses_multi_stage = True
-                        stage_names.append(stage_name)
-                        current_stage = stage_name
-
-                    if base_image is None:
-                        base_image = image
-
-                        # Check base image
-                        if ':latest' in image or ':' not in image:
-                            warnings.append(f"Line {i}: Base image uses 'latest' or no tag: {image}")
-
-                        if 'alpine' in image:
-                            info.append(f"Line {i}: Using Alpine Linux base (good for size)")
-
-                        if 'node:20' in image:
-                            info.append(f"Line {i}: Using Node.js 20 LTS (good choice)")
-
-            # Check for USER
-            elif stripped.upper().startswith('USER'):
-                has_user = True
-                user = stripped.split()[1] if len(stripped.split()) > 1 else ''
-                if user == 'root':
-                    errors.append(f"Line {i}: Running as root user (security risk)")
-                else:
-                    info.append(f"Line {i}: Running as non-root user '{user}' (good)")
-
-            # Check for HEALTHCHECK
-            elif stripped.upper().startswith('HEALTHCHECK'):
-                has_healthcheck = True
-                info.append(f"Line {i}: Health check configured (good)")
-
-            # Check for ENTRYPOINT
-            elif stripped.upper().startswith('ENTRYPOINT'):
-                has_entrypoint = True
-                if 'tini' in stripped or 'dumb-init' in stripped:
-                    info.append(f"Line {i}: Using init system for signal handling (good)")
-
-            # Check for CMD
-            elif stripped.upper().startswith('CMD'):
-                has_cmd = True
-
-            # Check RUN commands
-            elif stripped.upper().startswith('RUN'):
-                run_commands.append((i, stripped))
-
-                # Check for apt-get without -y
-                if 'apt-get' in stripped and '-y' not in stripped and '--yes' not in stripped:
-                    warnings.append(f"Line {i}: apt-get without -y (may hang)")
-
-                # Check for cache cleanup
-                if 'apt-get install' in stripped and 'rm -rf /var/lib/apt/lists/*' not in stripped:
-                    warnings.append(f"Line {i}: apt-get install without cache cleanup")
-
-                if 'apk add' in stripped and 'rm -rf /var/cache/apk/*' not in stripped:
-                    # Check if cleanup is on next line
-                    if i < len(lines) and 'rm -rf /var/cache/apk/*' not in lines[i]:
-                        info.append(f"Line {i}: Consider cleaning apk cache in same RUN")
-
-                # Check for npm ci vs npm install
-                if 'npm install' in stripped and 'npm ci' not in stripped:
-                    warnings.append(f"Line {i}: Use 'npm ci' instead of 'npm install' for reproducible builds")
-                elif 'npm ci' in stripped:
-                    info.append(f"Line {i}: Using 'npm ci' for reproducible builds (good)")
-
-            # Check COPY commands
-            elif stripped.upper().startswith('COPY'):
-                copy_commands.append((i, stripped))
-
-                # Check for --chown flag
-                if '--chown' in stripped:
-                    info.append(f"Line {i}: Using --chown in COPY (efficient)")
-
-            # Check WORKDIR
-            elif stripped.upper().startswith('WORKDIR'):
-                if not stripped.startswith('WORKDIR /'):
-                    warnings.append(f"Line {i}: WORKDIR should use absolute path")
-
-            # Check EXPOSE
-            elif stripped.upper().startswith('EXPOSE'):
-                port = stripped.split()[1] if len(stripped.split()) > 1 else ''
-                info.append(f"Line {i}: Exposing port {port}")
+            handler = _HANDLERS[match.group(1).upper()]
+            handler(i, line.strip(), match.group(2) or b'', state)
 
         # Overall checks
-        if not has_from:
+        if not state.has_from:
             errors.append("No FROM instruction found")
 
-        if not has_user:
+        if not state.has_user:
             warnings.append("No USER instruction (will run as root)")
 
-        if not has_healthcheck:
+        if not state.has_healthcheck:
             warnings.append("No HEALTHCHECK instruction (recommended)")
 
-        if not has_cmd and not has_entrypoint:
+        if not state.has_cmd and not state.has_entrypoint:
             errors.append("No CMD or ENTRYPOINT instruction")
 
-        if uses_multi_stage:
-            info.append(f"Multi-stage build detected ({len(stage_names)} stages: {', '.join(stage_names)})")
+        if state.uses_multi_stage:
+            info.append(f"Multi-stage build detected ({len(state.stage_names)} stages: {', '.join(state.stage_names)})")
             info.append("Multi-stage builds reduce final image size (good)")
 
-        if base_image:
-            info.append(f"Base image: {base_image}")
+        if state.base_image:
+            info.append(f"Base image: {state.base_image}")
 
         # Check layer optimization
-        if len(run_commands) > 10:
-            warnings.append(f"Many RUN commands ({len(run_commands)}). Consider combining for fewer layers.")
+        if len(state.run_commands) > 10:
+            warnings.append(f"Many RUN commands ({len(state.run_commands)}). Consider combining for fewer layers.")
 
     except Exception as e:
         errors.append(f"Error reading Dockerfile: {e}")
@@ -178,8 +238,7 @@ def check_required_files():
 
     print("📁 Checking required files...")
     for file_path, required in required_files:
-        path = Path(file_path)
-        if path.exists():
+        if _exists(file_path):
             print(f"   ✅ {file_path}")
         else:
             if required:
@@ -191,16 +250,14 @@ def check_required_files():
 
     print(f"\n📁 Checking optional files...")
     for file_path, _ in optional_files:
-        path = Path(file_path)
-        if path.exists():
+        if _exists(file_path):
             print(f"   ✅ {file_path}")
             info.append(f"Optional file present: {file_path}")
         else:
             print(f"   ⚠️  {file_path} (not found, may be optional)")
 
     # Check .dockerignore
-    dockerignore = Path('.dockerignore')
-    if not dockerignore.exists():
+    if not _exists('.dockerignore'):
         warnings.append(".dockerignore not found - may copy unnecessary files")
         info.append("Consider creating .dockerignore to reduce build context size")
     else:
@@ -215,10 +272,8 @@ def check_package_json():
     info = []
 
     try:
-        import json
-
-        with open('package.json', 'r') as f:
-            package = json.load(f)
+        with open('package.json', 'rb') as f:
+            package = json.loads(f.read())
 
         print("\n📦 Checking package.json scripts...")
 
@@ -3,10 +3,30 @@
 Advanced validation for Kubernetes manifests
 Checks best practices and common issues
 """
-import yaml
+import functools
+import itertools
+import os
 import sys
 from pathlib import Path
-from collections import defaultdict
+
+import yaml_cache
+
+@functools.lru_cache(maxsize=1)
+def _yaml_files(dirpath):
+    """List manifest files in a directory once, excluding kustomization.yaml (empty if missing)"""
+    try:
+        with os.scandir(dirpath) as entries:
+            return tuple(
+                Path(entry.path) for entry in entries
+                if entry.is_file() and entry.name.endswith('.yaml') and entry.name != 'kustomization.yaml'
+            )
+    except FileNotFoundError:
+        return ()
+
+@functools.lru_cache(maxsize=None)
+def _load_docs(file_path):
+    """Parse all documents in a YAML file once, skipping empty ones"""
+    return tuple(doc for doc in yaml_cache.load_all(file_path) if doc is not None)
 
 def validate_deployment(doc, file_path):
     """Validate Deployment best practices"""
@@ -111,10 +131,12 @@ def validate_secret(doc, file_path):
 
     data = doc.get('data', {})
     string_data = doc.get('stringData', {})
+    if not data and not string_data:
+        return errors, warnings
 
-    # Check for placeholder values
-    all_data = {**data, **string_data}
-    for key, value in all_data.items():
+    # Check for placeholder values (stringData overrides data for the same key)
+    data_items = ((key, value) for key, value in data.items() if key not in string_data)
+    for key, value in itertools.chain(data_items, string_data.items()):
         if value and 'CHANGE_ME' in str(value):
             warnings.append(f"{file_path}: Secret '{key}' contains CHANGE_ME placeholder")
 
@@ -158,13 +180,7 @@ def validate_advanced(file_path):
     warnings = []
 
     try:
-        with open(file_path, 'r') as f:
-            docs = list(yaml.safe_load_all(f.read()))
-
-        for doc in docs:
-            if doc is None:
-                continue
-
+        for doc in _load_docs(file_path):
             kind = doc.get('kind', '')
 
             if kind == 'Deployment' or kind == 'StatefulSet':
@@ -207,44 +223,29 @@ def check_label_consistency():
     errors = []
     warnings = []
 
-    k8s_dir = Path('k8s')
-    app_labels = defaultdict(set)
-
-    for yaml_file in k8s_dir.glob('*.yaml'):
-        if yaml_file.name == 'kustomization.yaml':
-            continue
+    all_apps = set()
 
+    for yaml_file in _yaml_files('k8s'):
         try:
-            with open(yaml_file, 'r') as f:
-                docs = list(yaml.safe_load_all(f.read()))
-
-            for doc in docs:
-                if doc is None:
-                    continue
-
+            for doc in _load_docs(yaml_file):
                 metadata = doc.get('metadata', {})
                 labels = metadata.get('labels', {})
 
                 app_label = labels.get('app')
                 if app_label:
-                    app_labels[yaml_file.name].add(app_label)
+                    all_apps.add(app_label)
 
         except Exception:
             pass
 
     # Check for consistency
-    all_apps = set()
-    for file_name, apps in app_labels.items():
-        all_apps.update(apps)
-
     if len(all_apps) > 5:  # Too many different app labels
         warnings.append(f"Found {len(all_apps)} different 'app' labels. Consider standardization.")
 
     return errors, warnings
 
 def main():
-    k8s_dir = Path('k8s')
-    yaml_files = [f for f in k8s_dir.glob('*.yaml') if f.name != 'kustomization.yaml']
+    yaml_files = _yaml_files('k8s')
 
     print(f"🔍 Running advanced validation on {len(yaml_files)} manifest files...\n")
 
@@ -254,32 +255,30 @@ def main():
     for yaml_file in sorted(yaml_files):
         errors, warnings = validate_advanced(yaml_file)
 
+        # Build the file's report and emit it with a single write
         if errors:
-            print(f"❌ {yaml_file.name}:")
-            for error in errors:
-                print(f"   ERROR: {error}")
+            buf = [f"❌ {yaml_file.name}:"]
+            buf.extend(f"   ERROR: {error}" for error in errors)
             all_errors.extend(errors)
         elif warnings:
-            print(f"⚠️  {yaml_file.name}:")
-            for warning in warnings:
-                print(f"   WARNING: {warning}")
+            buf = [f"⚠️  {yaml_file.name}:"]
+            buf.extend(f"   WARNING: {warning}" for warning in warnings)
             all_warnings.extend(warnings)
         else:
-            print(f"✅ {yaml_file.name}")
+            buf = [f"✅ {yaml_file.name}"]
+        sys.stdout.write('\n'.join(buf) + '\n')
 
     # Check label consistency
     print(f"\n📋 Checking label consistency...")
     errors, warnings = check_label_consistency()
     all_errors.extend(errors)
     all_warnings.extend(warnings)
-    if errors:
-        for error in errors:
-            print(f"   ERROR: {error}")
+    buf = [f"   ERROR: {error}" for error in errors]
     if warnings:
-        for warning in warnings:
-            print(f"   WARNING: {warning}")
+        buf.extend(f"   WARNING: {warning}" for warning in warnings)
     else:
-        print(f"   ✅ Labels are consistent")
+        buf.append(f"   ✅ Labels are consistent")
+    sys.stdout.write('\n'.join(buf) + '\n')
 
     print(f"\n{'='*60}")
     print(f"Summary:")
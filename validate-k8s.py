@@ -2,21 +2,21 @@
 """
 Validate Kubernetes YAML manifests
 """
+import os
 import yaml
 import sys
 from pathlib import Path
 
+import yaml_cache
+
 def validate_yaml_file(file_path):
     """Validate a single YAML file"""
     errors = []
     warnings = []
 
     try:
-        with open(file_path, 'r') as f:
-            content = f.read()
-
         # Parse YAML (supports multiple documents)
-        docs = list(yaml.safe_load_all(content))
+        docs = yaml_cache.load_all(file_path)
 
         if not docs:
             errors.append(f"No documents found in {file_path}")
@@ -81,6 +81,22 @@ def validate_yaml_file(file_path):
 
     return errors, warnings
 
+# Importing and starting a process pool costs ~20 ms against ~0.5 ms per manifest, so
+# it only pays off for large manifest sets on multi-core machines
+_PARALLEL_MIN_FILES = 64
+
+def _validate_all(yaml_files):
+    """Validate files in order, across processes when there are enough of them"""
+    if len(yaml_files) >= _PARALLEL_MIN_FILES and (os.cpu_count() or 1) > 1:
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor() as executor:
+                return list(executor.map(validate_yaml_file, yaml_files, chunksize=4))
+        except (ImportError, NotImplementedError, OSError):
+            # No working sem_open or /dev/shm on this platform; validate serially instead
+            pass
+    return [validate_yaml_file(yaml_file) for yaml_file in yaml_files]
+
 def main():
     k8s_dir = Path('k8s')
 
@@ -88,7 +104,7 @@ def main():
         print("❌ k8s directory not found")
         sys.exit(1)
 
-    yaml_files = list(k8s_dir.glob('*.yaml'))
+    yaml_files = sorted(k8s_dir.glob('*.yaml'))
 
     if not yaml_files:
         print("❌ No YAML files found in k8s directory")
@@ -99,21 +115,19 @@ def main():
     all_errors = []
     all_warnings = []
 
-    for yaml_file in sorted(yaml_files):
-        errors, warnings = validate_yaml_file(yaml_file)
-
+    for yaml_file, (errors, warnings) in zip(yaml_files, _validate_all(yaml_files)):
+        # Build the file's report and emit it with a single write
         if errors:
-            print(f"❌ {yaml_file.name}:")
-            for error in errors:
-                print(f"   ERROR: {error}")
+            buf = [f"❌ {yaml_file.name}:"]
+            buf.extend(f"   ERROR: {error}" for error in errors)
             all_errors.extend(errors)
         elif warnings:
-            print(f"⚠️  {yaml_file.name}:")
-            for warning in warnings:
-                print(f"   WARNING: {warning}")
+            buf = [f"⚠️  {yaml_file.name}:"]
+            buf.extend(f"   WARNING: {warning}" for warning in warnings)
             all_warnings.extend(warnings)
         else:
-            print(f"✅ {yaml_file.name}")
+            buf = [f"✅ {yaml_file.name}"]
+        sys.stdout.write('\n'.join(buf) + '\n')
 
     print(f"\n{'='*60}")
     print(f"Summary:")
@@ -11,16 +11,31 @@ success without human intervention.
 """
 
 import os
+import re
 import sys
 import json
-import subprocess
-import sqlite3
+import shlex
+import shutil
+import stat
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
-import urllib.request
-import urllib.error
+
+# sqlite3, subprocess and http.client are imported inside the checks that use them,
+# so runs that never reach those checks don't pay for loading them
+if TYPE_CHECKING:
+    from http.client import HTTPConnection
+
+# Separator line (with the preceding command's exit status) in batched `--version` output
+_STATUS_LINE_RE = re.compile(r'^---(\d+)$', re.MULTILINE)
+
+# KEY=value assignments in .env; comments and blank lines simply don't match
+_ENV_RE = re.compile(r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=(.*)$', re.MULTILINE)
 
 # ANSI color codes
 class Color:
@@ -37,7 +52,12 @@ class CheckStatus(Enum):
     FAIL = "FAIL"
     SKIP = "SKIP"
 
-@dataclass
+# __slots__ keeps results small and attribute access off the instance dict; dataclass
+# only generates them on 3.10+, and this script still supports 3.8
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Results are immutable once reported, so they can be shared and hashed safely
+@dataclass(frozen=True, **_SLOTS)
 class CheckResult:
     name: str
     status: CheckStatus
@@ -45,7 +65,102 @@ class CheckResult:
     details: Optional[str] = None
     fix_command: Optional[str] = None
 
+def _dir_names(path: Path) -> Set[str]:
+    """Names of a directory's entries from a single scandir (empty if unreadable)"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+def _dir_entries(path: Path) -> Dict[str, os.DirEntry]:
+    """A directory's entries by name from a single scandir (empty if unreadable)"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+def _collect_rel_files(root: Path) -> Set[str]:
+    """'/'-separated relative paths of all .js files under root, walked with scandir"""
+    found = set()
+    stack = [(str(root), "")]
+    while stack:
+        path, prefix = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, f"{prefix}{entry.name}/"))
+                    elif entry.name.endswith(".js") and entry.is_file():
+                        found.add(prefix + entry.name)
+        except OSError:
+            continue
+    return found
+
+def _is_executable(path: Path, st: os.stat_result) -> bool:
+    """X_OK test from an existing stat result, like os.access for the file's owner"""
+    # When we own the file (and aren't root) this reads the owner bit; group, ACL and root
+    # cases defer to os.access. Mount flags aren't in the mode bits, so a noexec mount still
+    # reads as executable here; writability (EROFS) is always left to os.access.
+    if hasattr(os, "geteuid") and st.st_uid == os.geteuid() != 0:
+        return bool(st.st_mode & stat.S_IXUSR)
+    return os.access(path, os.X_OK)
+
+def _is_shim(path: str, real_path: str) -> bool:
+    """Whether an executable is a version-manager shim (asdf, mise, nodenv, Volta)"""
+    # A shim picks the real tool at run time, so its own file says nothing about the version
+    return "shims" in Path(path).parts or "shim" in os.path.basename(real_path).lower()
+
+def _version_cache_key(tool: str, path: Optional[str]) -> Optional[str]:
+    """Identify a tool by name, PATH location, resolved path, mtime, ctime and size (None if uncacheable)"""
+    if path is None:
+        return None
+    real_path = os.path.realpath(path)
+    if _is_shim(path, real_path):
+        return None
+    try:
+        st = os.stat(real_path)
+    except OSError:
+        return None
+    # npm's entry point is a tiny script whose mtime comes from the package tarball, so
+    # ctime (which changes on reinstall) guards against in-place upgrades
+    return f"{tool}:{path}:{real_path}:{st.st_mtime_ns}:{st.st_ctime_ns}:{st.st_size}"
+
+def _version_cache_file() -> Path:
+    """Where `--version` outputs are cached, keyed by executable, so warm runs skip spawning node/npm"""
+    # Resolved on use: Path.home() raises without HOME or a passwd entry for this UID
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "alcs" / "verify_versions.json"
+
+def _load_version_cache() -> Dict[str, str]:
+    """Read cached `--version` outputs (empty if missing or unreadable)"""
+    try:
+        with open(_version_cache_file()) as f:
+            cache = json.load(f)
+    except (OSError, ValueError, RuntimeError, KeyError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def _save_version_cache(cache: Dict[str, str]) -> None:
+    """Atomically write the version cache; failures just mean a cold run next time"""
+    try:
+        cache_file = _version_cache_file()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, cache_file)
+    except (OSError, RuntimeError, KeyError):
+        pass
+
 class InstallationVerifier:
+    _STATUS_ICON: Dict[CheckStatus, str] = {
+        CheckStatus.PASS: f"{Color.GREEN}✓{Color.END}",
+        CheckStatus.WARN: f"{Color.YELLOW}⚠{Color.END}",
+        CheckStatus.FAIL: f"{Color.RED}✗{Color.END}",
+        CheckStatus.SKIP: f"{Color.BLUE}↷{Color.END}",
+    }
+
     def __init__(self, verbose: bool = False, auto_fix: bool = False):
         self.verbose = verbose
         self.auto_fix = auto_fix
@@ -53,37 +168,57 @@ class InstallationVerifier:
         self.results: List[CheckResult] = []
         self.critical_failures = 0
         self.warnings = 0
+        self.env_vars: Optional[Dict[str, str]] = None
+        # Kept open so further Ollama endpoints reuse the same socket
+        self._ollama_conn: Optional["HTTPConnection"] = None
+        # Checks run on worker threads; their verbose notes are held here until replayed in order
+        self._local = threading.local()
+        # Report lines, written to stdout in one go by _flush()
+        self._out: List[str] = []
+
+    def _emit(self, line: str):
+        """Queue a line of output"""
+        self._out.append(line)
+
+    def _flush(self):
+        """Write all queued output with a single write"""
+        if self._out:
+            sys.stdout.write("\n".join(self._out) + "\n")
+            sys.stdout.flush()
+            self._out.clear()
 
     def log(self, message: str, color: str = ""):
         """Print a log message with optional color"""
         if color:
-            print(f"{color}{message}{Color.END}")
+            self._emit(f"{color}{message}{Color.END}")
         else:
-            print(message)
+            self._emit(message)
 
-    def log_verbose(self, message: str):
-        """Print verbose message"""
-        if self.verbose:
-            print(f"  {Color.BLUE}ℹ {message}{Color.END}")
+    def log_verbose(self, fmt: str, *args):
+        """Print verbose message; %-style args are only formatted when verbose is on"""
+        if not self.verbose:
+            return
+        message = fmt % args if args else fmt
+        line = f"  {Color.BLUE}ℹ {message}{Color.END}"
+        notes = getattr(self._local, "notes", None)
+        if notes is not None:
+            notes.append(line)
+        else:
+            self._emit(line)
 
     def add_result(self, result: CheckResult):
         """Add a check result and update counters"""
         self.results.append(result)
 
-        icon = {
-            CheckStatus.PASS: f"{Color.GREEN}✓{Color.END}",
-            CheckStatus.WARN: f"{Color.YELLOW}⚠{Color.END}",
-            CheckStatus.FAIL: f"{Color.RED}✗{Color.END}",
-            CheckStatus.SKIP: f"{Color.BLUE}↷{Color.END}",
-        }[result.status]
+        icon = self._STATUS_ICON[result.status]
 
-        print(f"{icon} {result.name}: {result.message}")
+        self._emit(f"{icon} {result.name}: {result.message}")
 
         if result.details and self.verbose:
-            print(f"  {result.details}")
+            self._emit(f"  {result.details}")
 
         if result.fix_command:
-            print(f"  {Color.YELLOW}Fix: {result.fix_command}{Color.END}")
+            self._emit(f"  {Color.YELLOW}Fix: {result.fix_command}{Color.END}")
 
         if result.status == CheckStatus.FAIL:
             self.critical_failures += 1
@@ -92,6 +227,8 @@ class InstallationVerifier:
 
     def run_command(self, cmd: List[str], cwd: Optional[Path] = None) -> Tuple[int, str, str]:
         """Run a shell command and return exit code, stdout, stderr"""
+        import subprocess
+
         try:
             result = subprocess.run(
                 cmd,
@@ -106,41 +243,108 @@ class InstallationVerifier:
         except Exception as e:
             return -1, "", str(e)
 
-    def check_file_exists(self, path: Path, name: str, critical: bool = True) -> bool:
-        """Check if a file exists"""
-        if path.exists():
-            self.add_result(CheckResult(
+    def _node_versions(self) -> Tuple[Tuple[int, str], Tuple[int, str]]:
+        """Return (exit code, stdout) of `node --version` and `npm --version`"""
+        # Resolve both on PATH once; a missing tool is reported without spawning anything
+        exes = [shutil.which(exe) for exe in ("node", "npm")]
+        if not any(exes):
+            return (-1, ""), (-1, "")
+
+        # Reuse cached output while both binaries are unchanged since the last run. If node
+        # and npm resolve to the same file it is a dispatcher whose output can't be cached.
+        if exes[0] and exes[1] and os.path.realpath(exes[0]) == os.path.realpath(exes[1]):
+            keys = [None, None]
+        else:
+            keys = [_version_cache_key(tool, exe) for tool, exe in zip(("node", "npm"), exes)]
+        cache = _load_version_cache()
+        if all(key in cache for key in keys):
+            return (0, cache[keys[0]]), (0, cache[keys[1]])
+
+        versions = self._run_node_versions(*exes)
+        fresh = {key: stdout for key, (code, stdout) in zip(keys, versions) if key and code == 0}
+        if fresh:
+            _save_version_cache(fresh)
+        return versions
+
+    def _run_node_versions(self, node_exe: Optional[str],
+                           npm_exe: Optional[str]) -> Tuple[Tuple[int, str], Tuple[int, str]]:
+        """Spawn `--version` for whichever of the resolved node/npm paths exist"""
+        if os.name == "nt" or node_exe is None or npm_exe is None:
+            versions = []
+            for exe in (node_exe, npm_exe):
+                if exe is None:
+                    versions.append((-1, ""))
+                else:
+                    code, stdout, _ = self.run_command([exe, "--version"])
+                    versions.append((code, stdout))
+            return versions[0], versions[1]
+
+        # One shell spawn for both tools; each is followed by its own exit status
+        code, stdout, _ = self.run_command([
+            "sh", "-c",
+            f"{shlex.quote(node_exe)} --version; echo ---$?; {shlex.quote(npm_exe)} --version; echo ---$?",
+        ])
+        parts = _STATUS_LINE_RE.split(stdout)
+        if code != 0 or len(parts) != 5:
+            return (-1, ""), (-1, "")
+        return (int(parts[1]), parts[0]), (int(parts[3]), parts[2])
+
+    def check_file_exists(self, path: Path, name: str, critical: bool = True,
+                          exists: Optional[bool] = None) -> CheckResult:
+        """Check if a file exists (pass `exists` when it is already known)"""
+        if exists is None:
+            exists = path.exists()
+        if exists:
+            return CheckResult(
                 name=name,
                 status=CheckStatus.PASS,
                 message=f"Found: {path.name}"
-            ))
-            return True
+            )
         else:
-            self.add_result(CheckResult(
+            return CheckResult(
                 name=name,
                 status=CheckStatus.FAIL if critical else CheckStatus.WARN,
                 message=f"Missing: {path}",
                 details="File does not exist" if critical else "Optional file not found"
-            ))
-            return False
+            )
+
+    def _load_env(self) -> Optional[Dict[str, str]]:
+        """Parse .env into a dict (None if the file doesn't exist)"""
+        try:
+            text = (self.project_root / ".env").read_text()
+        except FileNotFoundError:
+            return None
+
+        env_vars = {}
+        for match in _ENV_RE.finditer(text):
+            env_vars[match.group(1)] = match.group(2).strip().strip('"').strip("'")
+        return env_vars
 
     # =========================================================================
     # Check 1: Project Structure
     # =========================================================================
 
-    def check_project_structure(self):
+    def check_project_structure(self) -> List[CheckResult]:
         """Verify essential project files and directories"""
-        self.log(f"\n{Color.BOLD}=== Project Structure ==={Color.END}")
+        results: List[CheckResult] = []
+
+        # One scandir each for the project root and prisma/ instead of a stat per path;
+        # DirEntry caches the file type, so the is_file()/is_dir() tests below are free
+        # except for symlinks
+        root_entries = _dir_entries(self.project_root)
+        prisma_entries = _dir_entries(self.project_root / "prisma")
 
         essential_files = [
-            (self.project_root / "package.json", "package.json"),
-            (self.project_root / "tsconfig.json", "tsconfig.json"),
-            (self.project_root / "prisma" / "schema.prisma", "Prisma schema"),
-            (self.project_root / ".env", "Environment config"),
+            (self.project_root / "package.json", "package.json", root_entries),
+            (self.project_root / "tsconfig.json", "tsconfig.json", root_entries),
+            (self.project_root / "prisma" / "schema.prisma", "Prisma schema", prisma_entries),
+            (self.project_root / ".env", "Environment config", root_entries),
         ]
 
-        for file_path, name in essential_files:
-            self.check_file_exists(file_path, name, critical=True)
+        for file_path, name, entries in essential_files:
+            entry = entries.get(file_path.name)
+            exists = entry is not None and (entry.is_file() or entry.is_dir())
+            results.append(self.check_file_exists(file_path, name, critical=True, exists=exists))
 
         essential_dirs = [
             (self.project_root / "src", "Source directory"),
@@ -149,48 +353,52 @@ class InstallationVerifier:
         ]
 
         for dir_path, name in essential_dirs:
-            if dir_path.exists() and dir_path.is_dir():
-                self.add_result(CheckResult(
+            entry = root_entries.get(dir_path.name)
+            if entry is not None and entry.is_dir():
+                results.append(CheckResult(
                     name=name,
                     status=CheckStatus.PASS,
                     message=f"Found: {dir_path.name}/"
                 ))
             else:
-                self.add_result(CheckResult(
+                results.append(CheckResult(
                     name=name,
                     status=CheckStatus.FAIL,
                     message=f"Missing: {dir_path}",
                     fix_command="npm install && npm run build"
                 ))
 
+        return results
+
     # =========================================================================
     # Check 2: Node.js and npm
     # =========================================================================
 
-    def check_nodejs(self):
+    def check_nodejs(self) -> List[CheckResult]:
         """Verify Node.js and npm installation"""
-        self.log(f"\n{Color.BOLD}=== Node.js Environment ==={Color.END}")
+        results: List[CheckResult] = []
+
+        (code, stdout), (npm_code, npm_stdout) = self._node_versions()
 
         # Check Node.js
-        code, stdout, stderr = self.run_command(["node", "--version"])
         if code == 0:
             version = stdout.strip()
             major_version = int(version.split('.')[0].replace('v', ''))
             if major_version >= 18:
-                self.add_result(CheckResult(
+                results.append(CheckResult(
                     name="Node.js version",
                     status=CheckStatus.PASS,
                     message=f"{version} (≥ v18 required)"
                 ))
             else:
-                self.add_result(CheckResult(
+                results.append(CheckResult(
                     name="Node.js version",
                     status=CheckStatus.FAIL,
                     message=f"{version} (need v18+)",
                     fix_command="Install Node.js v18+ from https://nodejs.org/"
                 ))
         else:
-            self.add_result(CheckResult(
+            results.append(CheckResult(
                 name="Node.js",
                 status=CheckStatus.FAIL,
                 message="Not found",
@@ -198,40 +406,29 @@ class InstallationVerifier:
             ))
 
         # Check npm
-        code, stdout, stderr = self.run_command(["npm", "--version"])
-        if code == 0:
-            self.add_result(CheckResult(
+        if npm_code == 0:
+            results.append(CheckResult(
                 name="npm",
                 status=CheckStatus.PASS,
-                message=f"Version {stdout.strip()}"
+                message=f"Version {npm_stdout.strip()}"
             ))
         else:
-            self.add_result(CheckResult(
+            results.append(CheckResult(
                 name="npm",
                 status=CheckStatus.FAIL,
                 message="Not found",
                 fix_command="npm is bundled with Node.js"
             ))
 
+        return results
+
     # =========================================================================
     # Check 3: Dependencies
     # =========================================================================
 
-    def check_dependencies(self):
+    def check_dependencies(self) -> List[CheckResult]:
         """Verify npm dependencies are installed"""
-        self.log(f"\n{Color.BOLD}=== Project Dependencies ==={Color.END}")
-
-        package_json = self.project_root / "package.json"
-        if not package_json.exists():
-            self.add_result(CheckResult(
-                name="package.json",
-                status=CheckStatus.FAIL,
-                message="Not found"
-            ))
-            return
-
-        with open(package_json) as f:
-            package_data = json.load(f)
+        results: List[CheckResult] = []
 
         # Check critical dependencies
         critical_deps = [
@@ -242,47 +439,61 @@ class InstallationVerifier:
 
         node_modules = self.project_root / "node_modules"
         if not node_modules.exists():
-            self.add_result(CheckResult(
+            results.append(CheckResult(
                 name="Dependencies",
                 status=CheckStatus.FAIL,
                 message="node_modules not found",
                 fix_command="npm install"
             ))
-            return
+            return results
+
+        # One listing of node_modules (plus one per @scope) instead of a stat per dependency
+        installed = _dir_names(node_modules)
+        scoped = {
+            scope: _dir_names(node_modules / scope)
+            for scope in {dep.split("/", 1)[0] for dep in critical_deps if dep.startswith("@")}
+        }
 
         for dep in critical_deps:
-            dep_path = node_modules / dep
-            if dep_path.exists():
-                self.add_result(CheckResult(
+            if dep.startswith("@"):
+                scope, name = dep.split("/", 1)
+                present = name in scoped[scope]
+            else:
+                present = dep in installed
+
+            if present:
+                results.append(CheckResult(
                     name=f"Dependency: {dep}",
                     status=CheckStatus.PASS,
                     message="Installed"
                 ))
             else:
-                self.add_result(CheckResult(
+                results.append(CheckResult(
                     name=f"Dependency: {dep}",
                     status=CheckStatus.FAIL,
                     message="Not installed",
                     fix_command="npm install"
                 ))
 
+        return results
+
     # =========================================================================
     # Check 4: TypeScript Compilation
     # =========================================================================
 
-    def check_build(self):
+    def check_build(self) -> List[CheckResult]:
         """Verify TypeScript build"""
-        self.log(f"\n{Color.BOLD}=== TypeScript Build ==={Color.END}")
+        results: List[CheckResult] = []
 
         dist_dir = self.project_root / "dist"
         if not dist_dir.exists():
-            self.add_result(CheckResult(
+            results.append(CheckResult(
                 name="Build output",
                 status=CheckStatus.FAIL,
                 message="dist/ directory not found",
                 fix_command="npm run build"
             ))
-            return
+            return results
 
         # Check for key compiled files
         key_files = [
@@ -292,58 +503,52 @@ class InstallationVerifier:
             "services/databaseService.js",
         ]
 
+        found = _collect_rel_files(dist_dir)
         all_exist = True
         for file_name in key_files:
-            file_path = dist_dir / file_name
-            if file_path.exists():
-                self.log_verbose(f"Found: {file_name}")
+            if file_name in found:
+                self.log_verbose("Found: %s", file_name)
             else:
                 all_exist = False
-                self.log_verbose(f"Missing: {file_name}")
+                self.log_verbose("Missing: %s", file_name)
 
         if all_exist:
-            self.add_result(CheckResult(
+            results.append(CheckResult(
                 name="Build artifacts",
                 status=CheckStatus.PASS,
                 message=f"All key files present in dist/"
             ))
         else:
-            self.add_result(CheckResult(
+            results.append(CheckResult(
                 name="Build artifacts",
                 status=CheckStatus.FAIL,
                 message="Missing compiled files",
                 fix_command="npm run build"
             ))
 
+        return results
+
     # =========================================================================
     # Check 5: Database
     # =========================================================================
 
-    def check_database(self):
+    def check_database(self) -> List[CheckResult]:
         """Verify database setup"""
-        self.log(f"\n{Color.BOLD}=== Database Configuration ==={Color.END}")
+        results: List[CheckResult] = []
 
         # Check .env for DATABASE_URL
-        env_file = self.project_root / ".env"
-        database_url = None
-
-        if env_file.exists():
-            with open(env_file) as f:
-                for line in f:
-                    if line.strip().startswith("DATABASE_URL="):
-                        database_url = line.split("=", 1)[1].strip().strip('"').strip("'")
-                        break
+        database_url = (self.env_vars or {}).get("DATABASE_URL")
 
         if not database_url:
-            self.add_result(CheckResult(
+            results.append(CheckResult(
                 name="DATABASE_URL",
                 status=CheckStatus.FAIL,
                 message="Not configured in .env",
                 fix_command='Add DATABASE_URL="file:./prisma/dev.db" to .env'
             ))
-            return
+            return results
 
-        self.add_result(CheckResult(
+        results.append(CheckResult(
             name="DATABASE_URL",
             status=CheckStatus.PASS,
             message=f"Configured: {database_url}"
@@ -354,123 +559,161 @@ class InstallationVerifier:
             db_path_str = database_url.replace("file:", "")
             db_path = (self.project_root / db_path_str).resolve()
 
-            if db_path.exists():
-                self.add_result(CheckResult(
+            import sqlite3
+
+            # Open read-only so a missing file raises instead of being created
+            conn = None
+            try:
+                conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)
+            except sqlite3.OperationalError as e:
+                connect_error = e
+
+            # Only stat on failure, to tell a missing file from one that can't be opened
+            if conn is None and not db_path.exists():
+                results.append(CheckResult(
+                    name="Database file",
+                    status=CheckStatus.FAIL,
+                    message="Not found",
+                    fix_command="npx prisma migrate dev --name init"
+                ))
+            else:
+                results.append(CheckResult(
                     name="Database file",
                     status=CheckStatus.PASS,
                     message=f"Found: {db_path.name}"
                 ))
 
-                # Try to connect and check tables
-                try:
-                    conn = sqlite3.connect(db_path)
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                    tables = [row[0] for row in cursor.fetchall()]
-                    conn.close()
-
-                    expected_tables = ["Session", "Artifact", "Review"]
-                    if all(table in tables for table in expected_tables):
-                        self.add_result(CheckResult(
-                            name="Database schema",
-                            status=CheckStatus.PASS,
-                            message=f"All tables present: {', '.join(expected_tables)}"
-                        ))
-                    else:
-                        self.add_result(CheckResult(
-                            name="Database schema",
-                            status=CheckStatus.FAIL,
-                            message="Missing tables",
-                            details=f"Found: {', '.join(tables)}",
-                            fix_command="npx prisma migrate dev --name init"
-                        ))
-                except Exception as e:
-                    self.add_result(CheckResult(
+                if conn is None:
+                    results.append(CheckResult(
                         name="Database connection",
                         status=CheckStatus.FAIL,
-                        message=f"Cannot connect: {str(e)}",
+                        message=f"Cannot connect: {str(connect_error)}",
                         fix_command="npx prisma migrate dev --name init"
                     ))
-            else:
-                self.add_result(CheckResult(
-                    name="Database file",
-                    status=CheckStatus.FAIL,
-                    message="Not found",
-                    fix_command="npx prisma migrate dev --name init"
-                ))
+                else:
+                    # Check tables in one query; set difference gives what's missing
+                    with closing(conn):
+                        try:
+                            cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+                            tables = [row[0] for row in cursor.fetchall()]
+
+                            expected_tables = ["Session", "Artifact", "Review"]
+                            if not set(expected_tables).difference(tables):
+                                results.append(CheckResult(
+                                    name="Database schema",
+                                    status=CheckStatus.PASS,
+                                    message=f"All tables present: {', '.join(expected_tables)}"
+                                ))
+                            else:
+                                results.append(CheckResult(
+                                    name="Database schema",
+                                    status=CheckStatus.FAIL,
+                                    message="Missing tables",
+                                    details=f"Found: {', '.join(tables)}",
+                                    fix_command="npx prisma migrate dev --name init"
+                                ))
+                        except Exception as e:
+                            results.append(CheckResult(
+                                name="Database connection",
+                                status=CheckStatus.FAIL,
+                                message=f"Cannot connect: {str(e)}",
+                                fix_command="npx prisma migrate dev --name init"
+                            ))
 
         # Check Prisma client generation
         prisma_client = self.project_root / "node_modules" / ".prisma" / "client"
         if prisma_client.exists():
-            self.add_result(CheckResult(
+            results.append(CheckResult(
                 name="Prisma client",
                 status=CheckStatus.PASS,
                 message="Generated"
             ))
         else:
-            self.add_result(CheckResult(
+            results.append(CheckResult(
                 name="Prisma client",
                 status=CheckStatus.FAIL,
                 message="Not generated",
                 fix_command="npx prisma generate"
             ))
 
+        return results
+
     # =========================================================================
     # Check 6: Ollama LLM Server
     # =========================================================================
 
-    def check_ollama(self):
+    def _ollama_get(self, ollama_url: str, endpoint: str) -> bytes:
+        """GET an Ollama endpoint over the shared keep-alive connection"""
+        from http.client import HTTPConnection, HTTPSConnection, HTTPException
+        from urllib.parse import urlsplit
+
+        url = urlsplit(ollama_url)
+        if self._ollama_conn is None:
+            if url.scheme not in ("http", "https"):
+                # Reported like any other unreachable server, as urllib's URLError was
+                raise OSError(f"unknown url type: {ollama_url.split(':', 1)[0]}")
+            connection_class = HTTPSConnection if url.scheme == "https" else HTTPConnection
+            self._ollama_conn = connection_class(url.hostname, url.port, timeout=5)
+
+        try:
+            self._ollama_conn.request("GET", url.path.rstrip("/") + endpoint)
+            response = self._ollama_conn.getresponse()
+            body = response.read()
+        except (OSError, HTTPException):
+            # Drop the socket; the next request reconnects
+            self._ollama_conn.close()
+            raise
+
+        if response.status != 200:
+            raise OSError(f"HTTP Error {response.status}: {response.reason}")
+        return body
+
+    def check_ollama(self) -> List[CheckResult]:
         """Verify Ollama server accessibility"""
-        self.log(f"\n{Color.BOLD}=== Ollama LLM Server ==={Color.END}")
+        from http.client import HTTPException
 
-        # Get Ollama URL from .env
-        env_file = self.project_root / ".env"
-        ollama_url = "http://localhost:11434"
+        results: List[CheckResult] = []
 
-        if env_file.exists():
-            with open(env_file) as f:
-                for line in f:
-                    if line.strip().startswith("OLLAMA_BASE_URL="):
-                        ollama_url = line.split("=", 1)[1].strip().strip('"').strip("'")
-                        break
+        # Get Ollama URL from .env
+        ollama_url = (self.env_vars or {}).get("OLLAMA_BASE_URL", "http://localhost:11434")
 
         # Check Ollama server
         try:
-            req = urllib.request.Request(f"{ollama_url}/api/tags")
-            with urllib.request.urlopen(req, timeout=5) as response:
-                data = json.loads(response.read().decode())
+            data = json.loads(self._ollama_get(ollama_url, "/api/tags"))
 
-                self.add_result(CheckResult(
-                    name="Ollama server",
-                    status=CheckStatus.PASS,
-                    message=f"Accessible at {ollama_url}"
-                ))
+            results.append(CheckResult(
+                name="Ollama server",
+                status=CheckStatus.PASS,
+                message=f"Accessible at {ollama_url}"
+            ))
 
-                # Check for required models
-                models = [model.get('name', '') for model in data.get('models', [])]
-
-                required_models = [
-                    ("qwen2.5-coder", "Agent Alpha"),
-                    ("deepseek-r1", "Agent Beta"),
-                ]
-
-                for model_name, agent_name in required_models:
-                    if any(model_name in m for m in models):
-                        self.add_result(CheckResult(
-                            name=f"Model: {agent_name}",
-                            status=CheckStatus.PASS,
-                            message=f"Found {model_name}"
-                        ))
-                    else:
-                        self.add_result(CheckResult(
-                            name=f"Model: {agent_name}",
-                            status=CheckStatus.WARN,
-                            message=f"{model_name} not found",
-                            fix_command=f"ollama pull {model_name}:32b"
-                        ))
-
-        except urllib.error.URLError as e:
-            self.add_result(CheckResult(
+            # Check for required models
+            models = [model.get('name', '') for model in data.get('models', [])]
+            # Installed names without the ":tag" suffix, so each lookup is one set probe
+            installed = {m.split(':', 1)[0] for m in models}
+
+            required_models = [
+                ("qwen2.5-coder", "Agent Alpha"),
+                ("deepseek-r1", "Agent Beta"),
+            ]
+
+            for model_name, agent_name in required_models:
+                if model_name in installed:
+                    results.append(CheckResult(
+                        name=f"Model: {agent_name}",
+                        status=CheckStatus.PASS,
+                        message=f"Found {model_name}"
+                    ))
+                else:
+                    results.append(CheckResult(
+                        name=f"Model: {agent_name}",
+                        status=CheckStatus.WARN,
+                        message=f"{model_name} not found",
+                        fix_command=f"ollama pull {model_name}:32b"
+                    ))
+
+        except (OSError, HTTPException) as e:
+            results.append(CheckResult(
                 name="Ollama server",
                 status=CheckStatus.WARN,
                 message=f"Not accessible at {ollama_url}",
@@ -478,30 +721,31 @@ class InstallationVerifier:
                 fix_command="Install Ollama from https://ollama.com/download"
             ))
         except Exception as e:
-            self.add_result(CheckResult(
+            results.append(CheckResult(
                 name="Ollama server",
                 status=CheckStatus.WARN,
                 message=f"Check failed: {str(e)}",
                 fix_command="Ensure Ollama is running: ollama serve"
             ))
 
+        return results
+
     # =========================================================================
     # Check 7: Configuration Validation
     # =========================================================================
 
-    def check_configuration(self):
+    def check_configuration(self) -> List[CheckResult]:
         """Validate configuration files"""
-        self.log(f"\n{Color.BOLD}=== Configuration Validation ==={Color.END}")
+        results: List[CheckResult] = []
 
-        env_file = self.project_root / ".env"
-        if not env_file.exists():
-            self.add_result(CheckResult(
+        if self.env_vars is None:
+            results.append(CheckResult(
                 name=".env file",
                 status=CheckStatus.FAIL,
                 message="Not found",
                 fix_command="cp .env.example .env"
             ))
-            return
+            return results
 
         # Check for required environment variables
         required_vars = [
@@ -510,52 +754,50 @@ class InstallationVerifier:
             "AGENT_BETA_MODEL",
         ]
 
-        env_vars = {}
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key.strip()] = value.strip().strip('"').strip("'")
-
         missing_vars = []
         for var in required_vars:
-            if var not in env_vars:
+            if var not in self.env_vars:
                 missing_vars.append(var)
 
         if missing_vars:
-            self.add_result(CheckResult(
+            results.append(CheckResult(
                 name="Environment variables",
                 status=CheckStatus.FAIL,
                 message=f"Missing: {', '.join(missing_vars)}",
                 fix_command="Add missing variables to .env"
             ))
         else:
-            self.add_result(CheckResult(
+            results.append(CheckResult(
                 name="Environment variables",
                 status=CheckStatus.PASS,
                 message="All required variables present"
             ))
 
+        return results
+
     # =========================================================================
     # Check 8: Permissions
     # =========================================================================
 
-    def check_permissions(self):
+    def check_permissions(self) -> List[CheckResult]:
         """Check file permissions"""
-        self.log(f"\n{Color.BOLD}=== File Permissions ==={Color.END}")
+        results: List[CheckResult] = []
 
         # Check if bootstrap.sh is executable
         bootstrap = self.project_root / "bootstrap.sh"
-        if bootstrap.exists():
-            if os.access(bootstrap, os.X_OK):
-                self.add_result(CheckResult(
+        try:
+            st = bootstrap.stat()
+        except FileNotFoundError:
+            st = None
+        if st is not None:
+            if _is_executable(bootstrap, st):
+                results.append(CheckResult(
                     name="bootstrap.sh",
                     status=CheckStatus.PASS,
                     message="Executable"
                 ))
             else:
-                self.add_result(CheckResult(
+                results.append(CheckResult(
                     name="bootstrap.sh",
                     status=CheckStatus.WARN,
                     message="Not executable",
@@ -563,22 +805,25 @@ class InstallationVerifier:
                 ))
 
         # Check write permissions for database directory
+        # os.access, not the mode bits: a read-only mount leaves u+w set but can't be written
         prisma_dir = self.project_root / "prisma"
         if prisma_dir.exists():
             if os.access(prisma_dir, os.W_OK):
-                self.add_result(CheckResult(
+                results.append(CheckResult(
                     name="prisma/ directory",
                     status=CheckStatus.PASS,
                     message="Writable"
                 ))
             else:
-                self.add_result(CheckResult(
+                results.append(CheckResult(
                     name="prisma/ directory",
                     status=CheckStatus.FAIL,
                     message="Not writable",
                     fix_command=f"chmod -R u+w {prisma_dir}"
                 ))
 
+        return results
+
     # =========================================================================
     # Summary and Recommendations
     # =========================================================================
@@ -590,10 +835,11 @@ class InstallationVerifier:
         self.log(f"{Color.BOLD}{'='*60}{Color.END}\n")
 
         total_checks = len(self.results)
-        passed = sum(1 for r in self.results if r.status == CheckStatus.PASS)
-        warnings = sum(1 for r in self.results if r.status == CheckStatus.WARN)
-        failed = sum(1 for r in self.results if r.status == CheckStatus.FAIL)
-        skipped = sum(1 for r in self.results if r.status == CheckStatus.SKIP)
+        counts = Counter(r.status for r in self.results)
+        passed = counts[CheckStatus.PASS]
+        warnings = counts[CheckStatus.WARN]
+        failed = counts[CheckStatus.FAIL]
+        skipped = counts[CheckStatus.SKIP]
 
         self.log(f"Total Checks:    {total_checks}")
         self.log(f"{Color.GREEN}Passed:          {passed}{Color.END}")
@@ -626,6 +872,15 @@ class InstallationVerifier:
     # Run All Checks
     # =========================================================================
 
+    def _run_check(self, check: Callable[[], List[CheckResult]]) -> Tuple[List[str], List[CheckResult]]:
+        """Run a check on a worker thread, capturing its verbose notes"""
+        notes = self._local.notes = []
+        try:
+            results = check()
+        finally:
+            self._local.notes = None
+        return notes, results
+
     def run_all_checks(self) -> int:
         """Execute all verification checks"""
         self.log(f"{Color.BOLD}ALCS Installation Verification{Color.END}")
@@ -633,15 +888,37 @@ class InstallationVerifier:
         self.log(f"Verbose: {self.verbose}")
         self.log(f"Auto-fix: {self.auto_fix}\n")
 
+        checks = [
+            ("Project Structure", self.check_project_structure),
+            ("Node.js Environment", self.check_nodejs),
+            ("Project Dependencies", self.check_dependencies),
+            ("TypeScript Build", self.check_build),
+            ("Database Configuration", self.check_database),
+            ("Ollama LLM Server", self.check_ollama),
+            ("Configuration Validation", self.check_configuration),
+            ("File Permissions", self.check_permissions),
+        ]
+
         try:
-            self.check_project_structure()
-            self.check_nodejs()
-            self.check_dependencies()
-            self.check_build()
-            self.check_database()
-            self.check_ollama()
-            self.check_configuration()
-            self.check_permissions()
+            # Every check that needs .env reads this one parsed copy
+            self.env_vars = self._load_env()
+
+            # The checks are independent, so overlap the Ollama request and the node/npm
+            # subprocesses with the filesystem checks. Results are reported on this thread,
+            # in the order above, so output and counters stay deterministic.
+            with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+                futures = [executor.submit(self._run_check, check) for _, check in checks]
+
+                for (title, _), future in zip(checks, futures):
+                    self.log(f"\n{Color.BOLD}=== {title} ==={Color.END}")
+                    notes, results = future.result()
+                    for note in notes:
+                        self._emit(note)
+                    for result in results:
+                        self.add_result(result)
+                    # Verbose runs show progress section by section; otherwise write once
+                    if self.verbose:
+                        self._flush()
 
             return self.print_summary()
 
@@ -652,8 +929,13 @@ class InstallationVerifier:
             self.log(f"\n{Color.RED}Verification failed with error: {str(e)}{Color.END}")
             if self.verbose:
                 import traceback
+                self._flush()
                 traceback.print_exc()
             return 1
+        finally:
+            self._flush()
+            if self._ollama_conn is not None:
+                self._ollama_conn.close()
 
 def main():
     import argparse
@@ -0,0 +1,59 @@
+"""
+On-disk cache of parsed YAML manifests, shared by the k8s validation scripts
+"""
+import hashlib
+import os
+import pickle
+import yaml
+from pathlib import Path
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+def _cache_dir():
+    """Where parsed documents are pickled, or None if there is no home directory to put them in"""
+    try:
+        return Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'alcs-yaml'
+    except (RuntimeError, KeyError):
+        return None
+
+def _parse(file_path):
+    """Parse all documents in a YAML file"""
+    with open(file_path, 'r') as f:
+        return list(yaml.load_all(f, Loader=SafeLoader))
+
+def load_all(file_path):
+    """Load all documents in a YAML file, reusing the pickled copy while the file is unchanged"""
+    directory = _cache_dir()
+    if directory is None:
+        return _parse(file_path)
+
+    path = Path(file_path).resolve()
+    st = path.stat()
+    signature = (st.st_mtime_ns, st.st_size)
+    # One cache file per manifest, overwritten whenever the manifest changes
+    cache_file = directory / f"{hashlib.sha1(str(path).encode()).hexdigest()}.pkl"
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_signature, docs = pickle.load(f)
+        if cached_signature == signature:
+            return docs
+    except Exception:
+        pass
+
+    docs = _parse(file_path)
+
+    # Write atomically; a cache we can't write just means parsing again next run
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((signature, docs), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+    return docs